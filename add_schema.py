@@ -5,49 +5,43 @@ Script para adicionar schema BENTIVI. em todas as tabelas do SQL
 
 import re
 import sys
+from pathlib import Path
+
+# Lista de todas as tabelas identificadas no script original
+TABLES = [
+    'estoque', 'topctrl', 'receber', 'cabrec', 'notacrc', 'INOTA', 'NOTA', 
+    'CICLO', 'CABTAB', 'TRANSAC', 'PROPRIED', 'MUNICIPIO', 'PESSOAL', 
+    'FUNCAOTOPER', 'TIPOOPER', 'CFO', 'PRODSERV', 'GRUPO', 'SUBGRUPO', 
+    'PRODUTO', 'transac', 'condicao', 'indexador', 'INDVALOR', 'inota', 
+    'nota', 'notaorig', 'INFENTRA', 'NOTAORIG', 'pedido', 'ipedido', 
+    'CULTURA', 'receita', 'ireceita', 'NFENTRA', 'IDOCDESFAZ', 'DOCDESFAZ', 
+    'CABDESFAZ'
+]
+
+# Remove duplicatas e ordena por tamanho (maiores primeiro para evitar substituições parciais)
+UNIQUE_TABLES = sorted(set(TABLES), key=len, reverse=True)
+
+# Um único padrão compilado com todas as tabelas: o texto é percorrido uma só vez
+# e o lookbehind evita duplicar o schema quando BENTIVI. já estiver presente
+TABLE_PATTERN = re.compile(
+    r'(?<!BENTIVI\.)\b(FROM|(?:(?:INNER|LEFT|RIGHT|FULL)[ \t\r\n]+)?JOIN)[ \t\r\n]+('
+    + '|'.join(re.escape(table) for table in UNIQUE_TABLES)
+    + r')\b',
+    flags=re.IGNORECASE
+)
 
 def add_bentivi_schema(sql_content):
     """
     Adiciona o schema BENTIVI. antes de todas as referências de tabelas Oracle
     """
+    print(f"Processando {len(UNIQUE_TABLES)} tabelas únicas...")
     
-    # Lista de todas as tabelas identificadas no script original
-    tables = [
-        'estoque', 'topctrl', 'receber', 'cabrec', 'notacrc', 'INOTA', 'NOTA', 
-        'CICLO', 'CABTAB', 'TRANSAC', 'PROPRIED', 'MUNICIPIO', 'PESSOAL', 
-        'FUNCAOTOPER', 'TIPOOPER', 'CFO', 'PRODSERV', 'GRUPO', 'SUBGRUPO', 
-        'PRODUTO', 'transac', 'condicao', 'indexador', 'INDVALOR', 'inota', 
-        'nota', 'notaorig', 'INFENTRA', 'NOTAORIG', 'pedido', 'ipedido', 
-        'CULTURA', 'receita', 'ireceita', 'NFENTRA', 'IDOCDESFAZ', 'DOCDESFAZ', 
-        'CABDESFAZ'
-    ]
+    # subn devolve o texto final e a contagem em uma única passada
+    sql_content, modifications = TABLE_PATTERN.subn(
+        lambda m: f"{m.group(1)} BENTIVI.{m.group(2)}", sql_content
+    )
     
-    # Remove duplicatas e ordena por tamanho (maiores primeiro para evitar substituições parciais)
-    unique_tables = sorted(set(tables), key=len, reverse=True)
-    
-    print(f"Processando {len(unique_tables)} tabelas únicas...")
-    
-    # Para cada tabela, adiciona BENTIVI. se não estiver presente
-    for table in unique_tables:
-        # Padrões para capturar diferentes contextos onde a tabela aparece
-        patterns = [
-            # FROM, JOIN patterns
-            rf'\b(FROM|JOIN|INNER JOIN|LEFT JOIN|RIGHT JOIN|FULL JOIN)\s+{table}\b',
-            # Patterns específicos para subqueries
-            rf'\bFROM\s+{table}\s+',
-            rf'\bJOIN\s+{table}\s+',
-        ]
-        
-        for pattern in patterns:
-            # Substitui apenas se BENTIVI. não estiver presente
-            replacement_pattern = rf'\1 BENTIVI.{table}'
-            if 'FROM' in pattern or 'JOIN' in pattern:
-                sql_content = re.sub(
-                    rf'(?<!BENTIVI\.)\b(FROM|INNER\s+JOIN|LEFT\s+JOIN|RIGHT\s+JOIN|FULL\s+JOIN|JOIN)\s+{re.escape(table)}\b',
-                    rf'\1 BENTIVI.{table}',
-                    sql_content,
-                    flags=re.IGNORECASE
-                )
+    print(f"{modifications} referências qualificadas com BENTIVI.")
     
     return sql_content
 
@@ -57,15 +51,13 @@ def main():
     
     try:
         print(f"Lendo arquivo: {input_file}")
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(input_file).read_text(encoding='utf-8')
         
         print("Aplicando schema BENTIVI...")
         updated_content = add_bentivi_schema(content)
         
         print(f"Salvando arquivo: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        Path(output_file).write_text(updated_content, encoding='utf-8')
         
         print("✅ Script concluído com sucesso!")
         print(f"📁 Arquivo final salvo em: {output_file}")
@@ -6,41 +6,67 @@ referenciados no arquivo carteira_pedido_venda_erp.sql
 
 import os
 import re
-import pandas as pd
+import sys
+import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Tuple, Any
 from sqlalchemy import create_engine, text
-import cx_Oracle
+
+from env_loader import load_env_once
 
 # Carregar variáveis de ambiente do arquivo .env
-try:
-    from dotenv import load_dotenv
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"✅ Configurações carregadas de: {env_path}")
-    else:
-        print("⚠️  Arquivo .env não encontrado no diretório do projeto")
-except ImportError:
-    print("⚠️  python-dotenv não instalado, usando variáveis de ambiente do sistema")
+load_env_once()
+
+# Logger para o detalhamento por objeto (formatação adiada até a emissão)
+logger = logging.getLogger(__name__)
+
+# Padrões aplicados sobre o SQL já convertido para maiúsculas (sem IGNORECASE)
+
+# Referências a tabelas/views BENTIVI em uma única alternação: FROM cobre DELETE FROM
+# e JOIN cobre INNER/LEFT/RIGHT JOIN
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN|UPDATE|INSERT\s+INTO)\s+BENTIVI\.([A-Z_][A-Z0-9_]*)')
+
+# Chamadas a functions BENTIVI; também cobre table functions, pois todo
+# TABLE(BENTIVI.X( contém BENTIVI.X(
+_FUNCTION_RE = re.compile(r'BENTIVI\.([A-Z_][A-Z0-9_]*)\s*\(')
+
+# Comentários de linha e de bloco removidos em uma única passada
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+
+# Schema dono dos objetos verificados
+BENTIVI_OWNER = 'BENTIVI'
+
+# Máximo de itens aceitos pelo Oracle em uma lista IN
+ORACLE_IN_LIST_LIMIT = 1000
+
+# Variáveis de ambiente obrigatórias para a conexão Oracle
+ORACLE_REQUIRED_ENV = ('ORACLE_HOST', 'ORACLE_USER', 'ORACLE_PASSWORD')
+
+# Separadores do relatório, montados uma única vez
+_SEP80 = "=" * 80 + "\n"
+_SEP60 = "-" * 60 + "\n"
+_SEP50 = "-" * 50 + "\n"
+_SECTION_END = "\n" + _SEP80 + "\n"
 
 def get_oracle_engine():
     """Cria engine SQLAlchemy para Oracle"""
     try:
-        oracle_host = os.getenv('ORACLE_HOST')
-        oracle_port = int(os.getenv('ORACLE_PORT', '1521'))
-        oracle_service = os.getenv('ORACLE_SERVICE_NAME', 'ORCL')
-        oracle_user = os.getenv('ORACLE_USER')
-        oracle_password = os.getenv('ORACLE_PASSWORD')
+        # Import adiado: só é necessário quando a conexão é de fato criada
+        import cx_Oracle
         
-        if not all([oracle_host, oracle_user, oracle_password]):
-            missing = []
-            if not oracle_host: missing.append('ORACLE_HOST')
-            if not oracle_user: missing.append('ORACLE_USER')
-            if not oracle_password: missing.append('ORACLE_PASSWORD')
+        # Variáveis obrigatórias lidas e validadas em uma única passada
+        required = {env: os.environ.get(env) for env in ORACLE_REQUIRED_ENV}
+        missing = [env for env, value in required.items() if not value]
+        if missing:
             raise ValueError(f"Variáveis obrigatórias não definidas: {missing}")
         
+        oracle_host = required['ORACLE_HOST']
+        oracle_user = required['ORACLE_USER']
+        oracle_password = required['ORACLE_PASSWORD']
+        oracle_port = int(os.environ.get('ORACLE_PORT', '1521'))
+        oracle_service = os.environ.get('ORACLE_SERVICE_NAME', 'ORCL')
+        
         print(f"📡 Conectando em Oracle: {oracle_host}:{oracle_port}/{oracle_service}")
         print(f"👤 Usuário: {oracle_user}")
         
@@ -54,8 +80,12 @@ def get_oracle_engine():
             pool_recycle=3600
         )
         
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1 FROM DUAL"))
+        # Validar com OCIPing do cx_Oracle, sem parse/execução de SQL
+        raw_conn = engine.raw_connection()
+        try:
+            raw_conn.ping()
+        finally:
+            raw_conn.close()
         
         print("✅ Conexão Oracle estabelecida com sucesso!")
         return engine
@@ -67,8 +97,7 @@ def get_oracle_engine():
 def read_sql_file(sql_file_path: str) -> str:
     """Lê conteúdo do arquivo SQL"""
     try:
-        with open(sql_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(sql_file_path).read_text(encoding='utf-8')
         print(f"✅ Arquivo SQL lido: {sql_file_path}")
         return content
     except Exception as e:
@@ -84,40 +113,14 @@ def extract_bentivi_objects(sql_content: str) -> Dict[str, Set[str]]:
         'views': set()
     }
     
-    # Padrões para encontrar objetos BENTIVI
-    patterns = {
-        'tables': [
-            r'FROM\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'JOIN\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'INNER\s+JOIN\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'LEFT\s+JOIN\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'RIGHT\s+JOIN\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'UPDATE\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'INSERT\s+INTO\s+BENTIVI\.([A-Z_][A-Z0-9_]*)',
-            r'DELETE\s+FROM\s+BENTIVI\.([A-Z_][A-Z0-9_]*)'
-        ],
-        'functions': [
-            r'BENTIVI\.([A-Z_][A-Z0-9_]*)\s*\(',
-            r'TABLE\s*\(\s*BENTIVI\.([A-Z_][A-Z0-9_]*)\s*\('
-        ]
-    }
-    
     # Remover comentários do SQL para análise mais limpa
-    sql_clean = re.sub(r'--.*$', '', sql_content, flags=re.MULTILINE)
-    sql_clean = re.sub(r'/\*.*?\*/', '', sql_clean, flags=re.DOTALL)
-    sql_clean = sql_clean.upper()
+    sql_clean = _COMMENT_RE.sub('', sql_content).upper()
     
     # Buscar tabelas e views
-    for pattern in patterns['tables']:
-        matches = re.findall(pattern, sql_clean, re.IGNORECASE)
-        for match in matches:
-            objects['tables'].add(match)
+    objects['tables'].update(_TABLE_RE.findall(sql_clean))
     
     # Buscar functions
-    for pattern in patterns['functions']:
-        matches = re.findall(pattern, sql_clean, re.IGNORECASE)
-        for match in matches:
-            objects['functions'].add(match)
+    objects['functions'].update(_FUNCTION_RE.findall(sql_clean))
     
     print(f"📋 Objetos extraídos do SQL:")
     print(f"   • Tabelas/Views: {len(objects['tables'])} encontradas")
@@ -125,203 +128,199 @@ def extract_bentivi_objects(sql_content: str) -> Dict[str, Set[str]]:
     
     return objects
 
-def check_object_access(engine, object_name: str, object_type: str) -> Dict[str, Any]:
-    """Verifica se o usuário GEODATA tem acesso a um objeto específico"""
-    queries = {
-        'table': """
-            SELECT 
-                COUNT(*) as has_access,
-                'TABLE' as object_type_found
-            FROM ALL_TABLES 
-            WHERE OWNER = 'BENTIVI' 
-            AND TABLE_NAME = :object_name
-        """,
-        'view': """
-            SELECT 
-                COUNT(*) as has_access,
-                'VIEW' as object_type_found
-            FROM ALL_VIEWS 
-            WHERE OWNER = 'BENTIVI' 
-            AND VIEW_NAME = :object_name
-        """,
-        'function': """
-            SELECT 
-                COUNT(*) as has_access,
-                OBJECT_TYPE as object_type_found
-            FROM ALL_OBJECTS 
-            WHERE OWNER = 'BENTIVI' 
-            AND OBJECT_NAME = :object_name
-            AND OBJECT_TYPE IN ('FUNCTION', 'PROCEDURE', 'PACKAGE')
-        """
-    }
+def check_objects_access(conn, objects: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Verifica em lote se o usuário GEODATA tem acesso aos objetos informados
     
-    result = {
-        'object_name': object_name,
-        'requested_type': object_type,
-        'has_access': False,
-        'found_type': None,
-        'error': None
-    }
+    Tabelas, views, functions, procedures e packages compartilham o mesmo
+    namespace no Oracle, então uma única consulta em ALL_OBJECTS resolve o
+    tipo de cada nome.
+    """
+    names = sorted({object_name for object_name, _ in objects})
+    found_types: Dict[str, str] = {}
+    error = None
     
     try:
-        # Tentar como tabela primeiro
-        with engine.connect() as conn:
-            df = pd.read_sql(queries['table'], conn, params={'object_name': object_name})
-            if df.iloc[0]['has_access'] > 0:
-                result['has_access'] = True
-                result['found_type'] = 'TABLE'
-                return result
-        
-        # Tentar como view
-        with engine.connect() as conn:
-            df = pd.read_sql(queries['view'], conn, params={'object_name': object_name})
-            if df.iloc[0]['has_access'] > 0:
-                result['has_access'] = True
-                result['found_type'] = 'VIEW'
-                return result
-        
-        # Tentar como function/procedure
-        with engine.connect() as conn:
-            df = pd.read_sql(queries['function'], conn, params={'object_name': object_name})
-            if df.iloc[0]['has_access'] > 0:
-                result['has_access'] = True
-                result['found_type'] = df.iloc[0]['object_type_found']
-                return result
-                
+        # Oracle limita listas IN a 1000 itens
+        for start in range(0, len(names), ORACLE_IN_LIST_LIMIT):
+            chunk = names[start:start + ORACLE_IN_LIST_LIMIT]
+            binds = {f'name_{i}': name for i, name in enumerate(chunk)}
+            query = f"""
+                SELECT 
+                    OBJECT_NAME as object_name,
+                    OBJECT_TYPE as object_type_found
+                FROM ALL_OBJECTS 
+                WHERE OWNER = :owner 
+                AND OBJECT_NAME IN ({', '.join(f':{bind}' for bind in binds)})
+                AND OBJECT_TYPE IN ('TABLE', 'VIEW', 'FUNCTION', 'PROCEDURE', 'PACKAGE')
+            """
+            
+            # Owner como bind: o texto do SQL só varia com o tamanho do lote
+            params = {'owner': BENTIVI_OWNER, **binds}
+            
+            # Cada linha já é o par (nome, tipo): não é preciso montar um DataFrame
+            found_types.update(conn.execute(text(query), params).fetchall())
+            
     except Exception as e:
-        result['error'] = str(e)
+        error = str(e)
     
-    return result
+    return [
+        {
+            'object_name': object_name,
+            'requested_type': object_type,
+            'has_access': object_name in found_types,
+            'found_type': found_types.get(object_name),
+            'error': None if object_name in found_types else error
+        }
+        for object_name, object_type in objects
+    ]
 
 def generate_access_report(sql_file_path: str, access_results: List[Dict[str, Any]], 
                           extracted_objects: Dict[str, Set[str]]) -> str:
     """Gera relatório de acesso aos objetos"""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    report_file = f"sql_objects_access_report_{timestamp}.txt"
+    now = datetime.now()
+    report_file = f"sql_objects_access_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
     
-    # Separar resultados por status
-    accessible_objects = [r for r in access_results if r['has_access']]
-    inaccessible_objects = [r for r in access_results if not r['has_access']]
-    error_objects = [r for r in access_results if r['error']]
+    # Separar resultados por status em uma única passada
+    accessible_objects, inaccessible_objects, error_objects = [], [], []
+    for r in access_results:
+        (accessible_objects if r['has_access'] else inaccessible_objects).append(r)
+        if r['error']:
+            error_objects.append(r)
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("="*80 + "\n")
-        f.write("RELATÓRIO DE ACESSO AOS OBJETOS DO SCHEMA BENTIVI\n")
-        f.write("="*80 + "\n")
-        f.write(f"Arquivo SQL analisado: {sql_file_path}\n")
-        f.write(f"Usuário: GEODATA\n")
-        f.write(f"Schema: BENTIVI\n")
-        f.write(f"Data/Hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("="*80 + "\n\n")
-        
-        # Resumo executivo
-        total_objects = len(access_results)
-        accessible_count = len(accessible_objects)
-        inaccessible_count = len(inaccessible_objects)
-        error_count = len(error_objects)
-        
-        f.write("📊 RESUMO EXECUTIVO\n")
-        f.write("-" * 50 + "\n")
-        f.write(f"Total de objetos analisados: {total_objects}\n")
-        f.write(f"✅ Objetos acessíveis: {accessible_count}\n")
-        f.write(f"❌ Objetos inacessíveis: {inaccessible_count}\n")
-        f.write(f"⚠️  Objetos com erro: {error_count}\n")
-        f.write(f"\n🎯 STATUS GERAL: ")
-        
-        if inaccessible_count == 0 and error_count == 0:
-            f.write("✅ TODOS OS OBJETOS SÃO ACESSÍVEIS\n")
-        else:
-            f.write("❌ EXISTEM OBJETOS INACESSÍVEIS\n")
-        
-        f.write("\n" + "="*80 + "\n\n")
-        
-        # Função específica QTDE_ENTR_PED_VEN
-        qtde_function = None
-        for obj in access_results:
-            if obj['object_name'] == 'QTDE_ENTR_PED_VEN':
-                qtde_function = obj
-                break
-        
-        f.write("🔍 VERIFICAÇÃO ESPECÍFICA: FUNCTION QTDE_ENTR_PED_VEN\n")
-        f.write("-" * 60 + "\n")
-        if qtde_function:
-            if qtde_function['has_access']:
-                f.write("✅ FUNCTION QTDE_ENTR_PED_VEN: ACESSÍVEL\n")
-                f.write(f"   Tipo encontrado: {qtde_function['found_type']}\n")
-            else:
-                f.write("❌ FUNCTION QTDE_ENTR_PED_VEN: NÃO ACESSÍVEL\n")
-                if qtde_function['error']:
-                    f.write(f"   Erro: {qtde_function['error']}\n")
-        else:
-            f.write("⚠️  FUNCTION QTDE_ENTR_PED_VEN: NÃO ENCONTRADA NA ANÁLISE\n")
-        
-        f.write("\n" + "="*80 + "\n\n")
-        
-        # Objetos acessíveis
-        if accessible_objects:
-            f.write("✅ OBJETOS ACESSÍVEIS\n")
-            f.write("="*80 + "\n")
-            for i, obj in enumerate(accessible_objects, 1):
-                f.write(f"{i:3d}. BENTIVI.{obj['object_name']} ({obj['found_type']})\n")
-            f.write(f"\nTotal: {len(accessible_objects)} objetos acessíveis\n")
-            f.write("\n" + "="*80 + "\n\n")
-        
-        # Objetos inacessíveis
-        if inaccessible_objects:
-            f.write("❌ OBJETOS INACESSÍVEIS\n")
-            f.write("="*80 + "\n")
-            f.write("⚠️  ATENÇÃO: Estes objetos são referenciados no SQL mas não são acessíveis!\n\n")
-            for i, obj in enumerate(inaccessible_objects, 1):
-                f.write(f"{i:3d}. BENTIVI.{obj['object_name']} (solicitado como {obj['requested_type']})\n")
-                if obj['error']:
-                    f.write(f"     Erro: {obj['error']}\n")
-            f.write(f"\nTotal: {len(inaccessible_objects)} objetos inacessíveis\n")
-            f.write("\n" + "="*80 + "\n\n")
-        
-        # Análise por tipo de objeto
-        f.write("📋 ANÁLISE POR TIPO DE OBJETO\n")
-        f.write("-" * 50 + "\n")
-        
-        for obj_type, objects in extracted_objects.items():
-            if objects:
-                f.write(f"\n{obj_type.upper()}:\n")
-                accessible_of_type = [o for o in accessible_objects if o['requested_type'] == obj_type]
-                inaccessible_of_type = [o for o in inaccessible_objects if o['requested_type'] == obj_type]
-                
-                f.write(f"  Total extraídos: {len(objects)}\n")
-                f.write(f"  Acessíveis: {len(accessible_of_type)}\n")
-                f.write(f"  Inacessíveis: {len(inaccessible_of_type)}\n")
-                
-                if inaccessible_of_type:
-                    f.write("  ❌ Objetos problemáticos:\n")
-                    for obj in inaccessible_of_type:
-                        f.write(f"     • {obj['object_name']}\n")
-        
-        # Conclusão
-        f.write("\n" + "="*80 + "\n")
-        f.write("📋 CONCLUSÃO\n")
-        f.write("="*80 + "\n")
-        
-        if inaccessible_count == 0 and error_count == 0:
-            f.write("✅ O usuário GEODATA tem acesso a TODOS os objetos referenciados\n")
-            f.write("   no arquivo carteira_pedido_venda_erp.sql\n")
-            f.write("\n🎉 O script SQL deve executar sem problemas de acesso!\n")
+    # Relatório montado em memória e gravado com uma única escrita
+    parts = []
+    
+    parts.append(_SEP80)
+    parts.append("RELATÓRIO DE ACESSO AOS OBJETOS DO SCHEMA BENTIVI\n")
+    parts.append(_SEP80)
+    parts.append(f"Arquivo SQL analisado: {sql_file_path}\n")
+    parts.append(f"Usuário: GEODATA\n")
+    parts.append(f"Schema: BENTIVI\n")
+    parts.append(f"Data/Hora: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    parts.extend((_SEP80, "\n"))
+    
+    # Resumo executivo
+    total_objects = len(access_results)
+    accessible_count = len(accessible_objects)
+    inaccessible_count = len(inaccessible_objects)
+    error_count = len(error_objects)
+    
+    parts.append("📊 RESUMO EXECUTIVO\n")
+    parts.append(_SEP50)
+    parts.append(f"Total de objetos analisados: {total_objects}\n")
+    parts.append(f"✅ Objetos acessíveis: {accessible_count}\n")
+    parts.append(f"❌ Objetos inacessíveis: {inaccessible_count}\n")
+    parts.append(f"⚠️  Objetos com erro: {error_count}\n")
+    parts.append(f"\n🎯 STATUS GERAL: ")
+    
+    if inaccessible_count == 0 and error_count == 0:
+        parts.append("✅ TODOS OS OBJETOS SÃO ACESSÍVEIS\n")
+    else:
+        parts.append("❌ EXISTEM OBJETOS INACESSÍVEIS\n")
+    
+    parts.append(_SECTION_END)
+    
+    # Função específica QTDE_ENTR_PED_VEN
+    qtde_function = next(
+        (obj for obj in access_results if obj['object_name'] == 'QTDE_ENTR_PED_VEN'), None
+    )
+    
+    parts.append("🔍 VERIFICAÇÃO ESPECÍFICA: FUNCTION QTDE_ENTR_PED_VEN\n")
+    parts.append(_SEP60)
+    if qtde_function:
+        if qtde_function['has_access']:
+            parts.append("✅ FUNCTION QTDE_ENTR_PED_VEN: ACESSÍVEL\n")
+            parts.append(f"   Tipo encontrado: {qtde_function['found_type']}\n")
         else:
-            f.write("❌ O usuário GEODATA NÃO tem acesso a alguns objetos referenciados\n")
-            f.write("   no arquivo carteira_pedido_venda_erp.sql\n")
-            f.write(f"\n⚠️  {inaccessible_count + error_count} objetos precisam de atenção!\n")
-            f.write("\nAções necessárias:\n")
-            f.write("• Verificar se os objetos existem no schema BENTIVI\n")
-            f.write("• Conceder privilégios necessários ao usuário GEODATA\n")
-            f.write("• Verificar sintaxe dos nomes dos objetos no SQL\n")
-        
-        f.write("\n" + "="*80 + "\n")
+            parts.append("❌ FUNCTION QTDE_ENTR_PED_VEN: NÃO ACESSÍVEL\n")
+            if qtde_function['error']:
+                parts.append(f"   Erro: {qtde_function['error']}\n")
+    else:
+        parts.append("⚠️  FUNCTION QTDE_ENTR_PED_VEN: NÃO ENCONTRADA NA ANÁLISE\n")
+    
+    parts.append(_SECTION_END)
+    
+    # Objetos acessíveis
+    if accessible_objects:
+        parts.append("✅ OBJETOS ACESSÍVEIS\n")
+        parts.append(_SEP80)
+        parts.extend(
+            f"{i:3d}. BENTIVI.{obj['object_name']} ({obj['found_type']})\n"
+            for i, obj in enumerate(accessible_objects, 1)
+        )
+        parts.append(f"\nTotal: {len(accessible_objects)} objetos acessíveis\n")
+        parts.append(_SECTION_END)
+    
+    # Objetos inacessíveis
+    if inaccessible_objects:
+        parts.append("❌ OBJETOS INACESSÍVEIS\n")
+        parts.append(_SEP80)
+        parts.append("⚠️  ATENÇÃO: Estes objetos são referenciados no SQL mas não são acessíveis!\n\n")
+        for i, obj in enumerate(inaccessible_objects, 1):
+            parts.append(f"{i:3d}. BENTIVI.{obj['object_name']} (solicitado como {obj['requested_type']})\n")
+            if obj['error']:
+                parts.append(f"     Erro: {obj['error']}\n")
+        parts.append(f"\nTotal: {len(inaccessible_objects)} objetos inacessíveis\n")
+        parts.append(_SECTION_END)
+    
+    # Análise por tipo de objeto
+    parts.append("📋 ANÁLISE POR TIPO DE OBJETO\n")
+    parts.append(_SEP50)
+    
+    # Agrupar uma única vez por tipo solicitado
+    accessible_by_type: Dict[str, List[Dict[str, Any]]] = {}
+    for obj in accessible_objects:
+        accessible_by_type.setdefault(obj['requested_type'], []).append(obj)
+    inaccessible_by_type: Dict[str, List[Dict[str, Any]]] = {}
+    for obj in inaccessible_objects:
+        inaccessible_by_type.setdefault(obj['requested_type'], []).append(obj)
+    
+    for obj_type, objects in extracted_objects.items():
+        if objects:
+            parts.append(f"\n{obj_type.upper()}:\n")
+            accessible_of_type = accessible_by_type.get(obj_type, [])
+            inaccessible_of_type = inaccessible_by_type.get(obj_type, [])
+            
+            parts.append(f"  Total extraídos: {len(objects)}\n")
+            parts.append(f"  Acessíveis: {len(accessible_of_type)}\n")
+            parts.append(f"  Inacessíveis: {len(inaccessible_of_type)}\n")
+            
+            if inaccessible_of_type:
+                parts.append("  ❌ Objetos problemáticos:\n")
+                for obj in inaccessible_of_type:
+                    parts.append(f"     • {obj['object_name']}\n")
+    
+    # Conclusão
+    parts.extend(("\n", _SEP80))
+    parts.append("📋 CONCLUSÃO\n")
+    parts.append(_SEP80)
+    
+    if inaccessible_count == 0 and error_count == 0:
+        parts.append("✅ O usuário GEODATA tem acesso a TODOS os objetos referenciados\n")
+        parts.append("   no arquivo carteira_pedido_venda_erp.sql\n")
+        parts.append("\n🎉 O script SQL deve executar sem problemas de acesso!\n")
+    else:
+        parts.append("❌ O usuário GEODATA NÃO tem acesso a alguns objetos referenciados\n")
+        parts.append("   no arquivo carteira_pedido_venda_erp.sql\n")
+        parts.append(f"\n⚠️  {inaccessible_count + error_count} objetos precisam de atenção!\n")
+        parts.append("\nAções necessárias:\n")
+        parts.append("• Verificar se os objetos existem no schema BENTIVI\n")
+        parts.append("• Conceder privilégios necessários ao usuário GEODATA\n")
+        parts.append("• Verificar sintaxe dos nomes dos objetos no SQL\n")
+    
+    parts.extend(("\n", _SEP80))
+    
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
     
     print(f"📋 Relatório salvo em: {report_file}")
     return report_file
 
 def main():
     """Função principal"""
+    # Mesmo stream dos prints, para que redirecionamentos e pipes mantenham a ordem
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     print("🔍 VERIFICAÇÃO DE ACESSO AOS OBJETOS DO SQL")
     print("=" * 80)
     print("📄 Arquivo: carteira_pedido_venda_erp.sql")
@@ -363,25 +362,26 @@ def main():
         print("🔐 VERIFICANDO ACESSO AOS OBJETOS")
         print("="*80)
         
-        access_results = []
-        all_objects = []
-        
         # Juntar todos os objetos com seus tipos
-        for obj_type, objects in extracted_objects.items():
-            for obj_name in objects:
-                all_objects.append((obj_name, obj_type))
+        all_objects = [
+            (obj_name, obj_type)
+            for obj_type, objects in extracted_objects.items()
+            for obj_name in objects
+        ]
+        
+        print(f"🔍 Verificando {len(all_objects)} objetos em uma única consulta...")
+        with engine.connect() as conn:
+            access_results = check_objects_access(conn, all_objects)
         
-        for obj_name, obj_type in all_objects:
-            print(f"🔍 Verificando: BENTIVI.{obj_name} ({obj_type})")
-            result = check_object_access(engine, obj_name, obj_type)
-            access_results.append(result)
+        for result in access_results:
+            logger.info("🔍 BENTIVI.%s (%s)", result['object_name'], result['requested_type'])
             
             if result['has_access']:
-                print(f"   ✅ Acessível como {result['found_type']}")
+                logger.info("   ✅ Acessível como %s", result['found_type'])
             else:
-                print(f"   ❌ Não acessível")
+                logger.info("   ❌ Não acessível")
                 if result['error']:
-                    print(f"   ⚠️  Erro: {result['error']}")
+                    logger.info("   ⚠️  Erro: %s", result['error'])
         
         # Gerar relatório
         print("\n" + "="*80)
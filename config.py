@@ -10,21 +10,16 @@ SEGURANÇA:
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
+from env_loader import load_env_once
 
 # Carregar variáveis de ambiente do arquivo .env se existir
-try:
-    from dotenv import load_dotenv
-    # Procurar arquivo .env no diretório do projeto
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"✅ Configurações carregadas de: {env_path}")
-    else:
-        print("⚠️  Arquivo .env não encontrado, usando variáveis de ambiente do sistema")
-except ImportError:
-    print("⚠️  python-decouple não instalado, usando variáveis de ambiente do sistema")
+load_env_once()
 
 # =====================================
 # CONFIGURAÇÕES DE PATHS
@@ -150,6 +145,9 @@ ETL_CONFIG = {
     # Tamanho do batch para inserção
     'batch_size': int(os.getenv('ETL_BATCH_SIZE', '1000')),
     
+    # Linhas buscadas por round-trip na extração Oracle (arraysize do cursor)
+    'oracle_arraysize': int(os.getenv('ETL_ORACLE_ARRAYSIZE', '5000')),
+    
     # Prefixo para tabelas (opcional)
     'table_prefix': os.getenv('ETL_TABLE_PREFIX', ''),
     
@@ -161,14 +159,20 @@ ETL_CONFIG = {
     
     # Arquivos SQL para ignorar (regex patterns) - aplicado apenas ao nome do arquivo
     'ignore_patterns': [
+        # Todos ancorados em ^ ou $; aplicados com search, então dispensam o prefixo .*
         r'^test.*\.sql$',      # Arquivos que começam com "test"
-        r'.*_test\.sql$',      # Arquivos que terminam com "_test.sql"
+        r'_test\.sql$',        # Arquivos que terminam com "_test.sql"
         r'^backup.*\.sql$',    # Arquivos que começam com "backup"
-        r'.*_backup\.sql$',    # Arquivos que terminam com "_backup.sql"
-        r'.*\.bak\.sql$'       # Arquivos .bak.sql
+        r'_backup\.sql$',      # Arquivos que terminam com "_backup.sql"
+        r'\.bak\.sql$'         # Arquivos .bak.sql
     ]
 }
 
+# Padrões de arquivos ignorados compilados uma única vez (comparação sem diferenciar maiúsculas)
+IGNORE_PATTERNS_COMPILED = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in ETL_CONFIG['ignore_patterns']
+)
+
 # =====================================
 # CONFIGURAÇÕES DE LOG
 # =====================================
@@ -186,8 +190,8 @@ LOG_CONFIG = {
 # MAPEAMENTO DE TIPOS DE DADOS
 # =====================================
 
-# Mapeamento Oracle -> PostgreSQL
-TYPE_MAPPING = {
+# Mapeamento Oracle -> PostgreSQL (somente leitura, consulta direta por chave)
+TYPE_MAPPING = MappingProxyType({
     # Numéricos
     'NUMBER': 'NUMERIC',
     'INTEGER': 'INTEGER', 
@@ -218,7 +222,7 @@ TYPE_MAPPING = {
     # Outros
     'ROWID': 'VARCHAR(18)',
     'UROWID': 'VARCHAR(4000)'
-}
+})
 
 # Tipos padrão para inferência pandas
 PANDAS_TO_POSTGRESQL = {
@@ -237,8 +241,10 @@ PANDAS_TO_POSTGRESQL = {
 # FUNÇÕES HELPER
 # =====================================
 
+@lru_cache(maxsize=1)
 def get_oracle_connection_string():
-    """Retorna string de conexão Oracle para SQLAlchemy"""
+    """Retorna string de conexão Oracle para SQLAlchemy (montada uma única vez)"""
+    # Import local: main.py valida a instalação do cx_Oracle depois de importar config
     import cx_Oracle
     dsn = cx_Oracle.makedsn(
         ORACLE_CONFIG['host'], 
@@ -247,12 +253,20 @@ def get_oracle_connection_string():
     )
     return f"oracle+cx_oracle://{ORACLE_CONFIG['user']}:{ORACLE_CONFIG['password']}@{dsn}"
 
+@lru_cache(maxsize=1)
 def get_postgresql_connection_string():
-    """Retorna string de conexão PostgreSQL para SQLAlchemy"""
+    """Retorna string de conexão PostgreSQL para SQLAlchemy (montada uma única vez)"""
     return (f"postgresql://{POSTGRESQL_CONFIG['user']}:{POSTGRESQL_CONFIG['password']}"
             f"@{POSTGRESQL_CONFIG['host']}:{POSTGRESQL_CONFIG['port']}"
             f"/{POSTGRESQL_CONFIG['database']}")
 
+def get_ignore_pattern(file_name: str) -> Optional[str]:
+    """Retorna o padrão que faz o arquivo ser ignorado, ou None se deve ser processado"""
+    for pattern in IGNORE_PATTERNS_COMPILED:
+        if pattern.search(file_name):
+            return pattern.pattern
+    return None
+
 def get_table_name_from_file(sql_file_path):
     """Extrai nome da tabela a partir do nome do arquivo SQL"""
     file_name = Path(sql_file_path).stem  # Remove extensão
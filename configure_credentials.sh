@@ -278,6 +278,7 @@ echo ""
 ETL_LOAD_STRATEGY=$(read_with_default "Estratégia de carga (replace/append)" "replace")
 ETL_QUERY_TIMEOUT=$(read_with_default "Timeout de queries (segundos)" "300")
 ETL_BATCH_SIZE=$(read_with_default "Tamanho do batch" "1000")
+ETL_ORACLE_ARRAYSIZE=$(read_with_default "Linhas por busca no Oracle (arraysize)" "5000")
 ETL_LOG_LEVEL=$(read_with_default "Nível de log (DEBUG/INFO/WARNING/ERROR)" "INFO")
 
 echo ""
@@ -348,6 +349,7 @@ POSTGRES_PASSWORD=$POSTGRES_PASSWORD
 ETL_LOAD_STRATEGY=$ETL_LOAD_STRATEGY
 ETL_QUERY_TIMEOUT=$ETL_QUERY_TIMEOUT
 ETL_BATCH_SIZE=$ETL_BATCH_SIZE
+ETL_ORACLE_ARRAYSIZE=$ETL_ORACLE_ARRAYSIZE
 ETL_LOG_LEVEL=$ETL_LOG_LEVEL
 
 # DIRETÓRIOS
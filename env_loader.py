@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Carregamento das variáveis de ambiente do arquivo .env
+Compartilhado por config.py e pelos scripts auxiliares do projeto
+"""
+
+from pathlib import Path
+
+# Arquivo .env no diretório do projeto
+ENV_PATH = Path(__file__).parent / '.env'
+
+# Evita ler e interpretar o .env mais de uma vez no mesmo processo
+_env_loaded = False
+
+def load_env_once():
+    """Carrega o arquivo .env na primeira chamada; as seguintes não fazem nada"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    try:
+        from dotenv import load_dotenv
+        if ENV_PATH.exists():
+            load_dotenv(ENV_PATH)
+            print(f"✅ Configurações carregadas de: {ENV_PATH}")
+        else:
+            print("⚠️  Arquivo .env não encontrado, usando variáveis de ambiente do sistema")
+    except ImportError:
+        print("⚠️  python-dotenv não instalado, usando variáveis de ambiente do sistema")
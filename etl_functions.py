@@ -10,6 +10,7 @@ import psycopg2
 import sqlalchemy
 from sqlalchemy import create_engine, text, MetaData, Table, Column, inspect
 import logging
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
@@ -20,12 +21,28 @@ from config import (
     ORACLE_CONFIG, POSTGRESQL_CONFIG, ETL_CONFIG, 
     TYPE_MAPPING, PANDAS_TO_POSTGRESQL,
     get_oracle_connection_string, get_postgresql_connection_string,
-    get_table_name_from_file
+    get_table_name_from_file, get_ignore_pattern
 )
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Comentários e comandos Oracle específicos (SQL*Plus) removidos em uma única passada.
+# Só o comentário de bloco atravessa linhas (?s:); os comandos só valem no início da
+# linha (?m:^), para não capturar OFFSET/UPDATE ... SET nem avançar até um ';' de comentário
+_SQL_NOISE_RE = re.compile(
+    r'--[^\n]*'
+    r'|(?s:/\*.*?\*/)'
+    r'|(?m:^\s*SET\s+\w+[^\n]*?;)'
+    r'|(?m:^\s*WHENEVER\s+[^\n]*?;)'
+    r'|(?m:^\s*SPOOL\s+[^\n]*?;)'
+    r'|(?m:^\s*PROMPT\s+[^\n]*?;)',
+    re.IGNORECASE
+)
+
+# Linhas em branco consecutivas
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
 class ETLProcessor:
     """Classe principal para processamento ETL"""
     
@@ -51,7 +68,8 @@ class ETLProcessor:
                 oracle_conn_str,
                 echo=False,
                 pool_pre_ping=True,
-                pool_recycle=3600
+                pool_recycle=3600,
+                arraysize=ETL_CONFIG['oracle_arraysize']
             )
             
             # Teste conexão Oracle
@@ -87,28 +105,28 @@ class ETLProcessor:
             logger.error(f"Diretório não encontrado: {sql_dir}")
             return []
         
-        # Buscar arquivos SQL
-        sql_files = []
-        for ext in ETL_CONFIG['sql_extensions']:
-            sql_files.extend(sql_path.glob(f"*{ext}"))
+        # Buscar arquivos SQL (uma única leitura do diretório para todas as extensões)
+        extensions = tuple(ETL_CONFIG['sql_extensions'])
+        with os.scandir(sql_path) as entries:
+            sql_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(extensions)
+                and entry.is_file()
+            ]
         
         # Filtrar arquivos ignorados
         filtered_files = []
         for file_path in sql_files:
-            skip_file = False
             file_name = file_path.name  # Usar apenas o nome do arquivo, não o caminho completo
             
-            for pattern in ETL_CONFIG['ignore_patterns']:
-                if re.search(pattern, file_name, re.IGNORECASE):
-                    logger.info(f"⏭️  Ignorando arquivo: {file_name} (padrão: {pattern})")
-                    skip_file = True
-                    break
+            pattern = get_ignore_pattern(file_name)
             
-            if not skip_file:
+            if pattern:
+                logger.info(f"⏭️  Ignorando arquivo: {file_name} (padrão: {pattern})")
+                logger.debug(f"❌ Rejeitado arquivo: {file_name}")
+            else:
                 logger.debug(f"✅ Aceito arquivo: {file_name}")
                 filtered_files.append(file_path)
-            else:
-                logger.debug(f"❌ Rejeitado arquivo: {file_name}")
         
         logger.info(f"📁 Encontrados {len(filtered_files)} arquivos SQL para processamento ({len(sql_files)} total, {len(sql_files) - len(filtered_files)} ignorados)")
         return sorted(filtered_files)
@@ -119,8 +137,7 @@ class ETLProcessor:
             logger.info(f"🔍 Extraindo dados de: {sql_file.name}")
             
             # Ler conteúdo do arquivo SQL
-            with open(sql_file, 'r', encoding='utf-8') as f:
-                sql_content = f.read().strip()
+            sql_content = sql_file.read_text(encoding='utf-8').strip()
             
             if not sql_content:
                 logger.warning(f"⚠️  Arquivo SQL vazio: {sql_file.name}")
@@ -150,25 +167,11 @@ class ETLProcessor:
     
     def _clean_sql(self, sql_content: str) -> str:
         """Limpa SQL removendo comandos problemáticos"""
-        # Remover comentários de linha única
-        sql_content = re.sub(r'--.*$', '', sql_content, flags=re.MULTILINE)
-        
-        # Remover comentários de bloco
-        sql_content = re.sub(r'/\*.*?\*/', '', sql_content, flags=re.DOTALL)
-        
-        # Remover comandos Oracle específicos que podem causar problema
-        oracle_commands = [
-            r'SET\s+\w+.*?;',
-            r'WHENEVER\s+.*?;',
-            r'SPOOL\s+.*?;',
-            r'PROMPT\s+.*?;'
-        ]
-        
-        for cmd in oracle_commands:
-            sql_content = re.sub(cmd, '', sql_content, flags=re.IGNORECASE)
+        # Remover comentários e comandos Oracle específicos que podem causar problema
+        sql_content = _SQL_NOISE_RE.sub('', sql_content)
         
         # Remover múltiplas quebras de linha
-        sql_content = re.sub(r'\n\s*\n', '\n', sql_content)
+        sql_content = _BLANK_LINES_RE.sub('\n', sql_content)
         
         return sql_content.strip()
     
@@ -3,54 +3,74 @@
 Script para corrigir tabelas que faltaram o schema BENTIVI
 """
 
+import os
 import re
+import mmap
 from pathlib import Path
 import shutil
 from datetime import datetime
 
+# Lista de tabelas que podem estar sem schema
+# Tabelas que comumente ficam sem schema em subqueries ou JOINs específicos
+TABLE_FIXES = [
+    'CFO',
+    'TRANSAC',
+    'NEGOCIACAO',
+    'INDVALOR',
+    'CABREC',
+    'NOTA N',
+    'NFENTRA N',
+]
+
+# Todas as tabelas em uma única alternação (maiores primeiro): cada arquivo é
+# percorrido uma só vez e o lookbehind ignora referências já com BENTIVI.
+_FIX_RE = re.compile(
+    r'\b(?<!BENTIVI\.)('
+    + '|'.join(re.escape(table) for table in sorted(TABLE_FIXES, key=len, reverse=True))
+    + r')\b'
+)
+
+# Mesmo padrão em bytes, para sondar o arquivo mapeado em memória sem decodificá-lo
+_FIX_RE_BYTES = re.compile(_FIX_RE.pattern.encode('utf-8'))
+
+def needs_fix(sql_file: Path) -> bool:
+    """Verifica, sem ler o arquivo inteiro para a memória, se há tabela sem schema"""
+    if sql_file.stat().st_size == 0:
+        return False  # mmap não aceita arquivos vazios
+    with open(sql_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _FIX_RE_BYTES.search(mm) is not None
+
 def fix_missing_schemas():
     """Corrige schemas faltantes nos arquivos SQL"""
     
     sql_dir = Path("sqls")
     
-    # Lista de tabelas que podem estar sem schema
-    table_fixes = [
-        # Tabelas que comumente ficam sem schema em subqueries ou JOINs específicos
-        ('CFO', 'BENTIVI.CFO'),
-        ('TRANSAC', 'BENTIVI.TRANSAC'),
-        ('NEGOCIACAO', 'BENTIVI.NEGOCIACAO'),
-        ('INDVALOR', 'BENTIVI.INDVALOR'),
-        ('CABREC', 'BENTIVI.CABREC'),
-        ('NOTA N', 'BENTIVI.NOTA N'),
-        ('NFENTRA N', 'BENTIVI.NFENTRA N'),
-    ]
+    with os.scandir(sql_dir) as entries:
+        sql_files = [Path(entry.path) for entry in entries
+                     if entry.name.endswith('.sql')
+                     and entry.is_file()]
     
-    for sql_file in sql_dir.glob("*.sql"):
+    for sql_file in sql_files:
         print(f"\n🔄 Verificando: {sql_file.name}")
         
-        with open(sql_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Arquivos já corretos não são decodificados nem regravados
+        if not needs_fix(sql_file):
+            print(f"   ✅ Nenhuma correção necessária")
+            continue
         
-        original_content = content
-        fixes_made = 0
+        content = sql_file.read_text(encoding='utf-8')
         
-        # Corrigir tabelas específicas que ficaram sem schema
-        for old_pattern, new_pattern in table_fixes:
-            # Procurar padrões onde a tabela não tem schema
-            pattern = rf'\b(?<!BENTIVI\.){re.escape(old_pattern)}\b'
-            if re.search(pattern, content):
-                content = re.sub(pattern, new_pattern, content)
-                fixes_made += 1
+        # Corrigir tabelas específicas que ficaram sem schema em uma única passada
+        content, fixes_made = _FIX_RE.subn(lambda m: 'BENTIVI.' + m.group(1), content)
         
-        # Verificar se houve mudanças
-        if content != original_content:
+        # Verificar se houve mudanças (toda correção contada altera o conteúdo)
+        if fixes_made:
             # Fazer backup antes de alterar
             backup_file = sql_file.with_suffix(f'.sql.bak_{datetime.now().strftime("%H%M%S")}')
             shutil.copy2(sql_file, backup_file)
             
             # Salvar arquivo corrigido
-            with open(sql_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            sql_file.write_text(content, encoding='utf-8')
             
             print(f"   ✅ {fixes_made} correções aplicadas")
             print(f"   💾 Backup: {backup_file.name}")
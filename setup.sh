@@ -387,7 +387,7 @@ fi
 
 # Copiar arquivos Python principais
 echo -e "🐍 Copiando arquivos Python..."
-PYTHON_FILES=("main.py" "config.py" "etl_functions.py" "test_connections.py")
+PYTHON_FILES=("main.py" "config.py" "env_loader.py" "etl_functions.py" "test_connections.py")
 for file in "${PYTHON_FILES[@]}"; do
     if [ -f "$SOURCE_DIR/$file" ]; then
         cp "$SOURCE_DIR/$file" .
@@ -457,7 +457,7 @@ echo -e "${BLUE}🔒 Configuração de credenciais será feita na próxima etapa
 echo -e "\n${YELLOW}✅ 11. Validação final do setup...${NC}"
 
 # Verificar se todos os arquivos necessários estão no lugar
-REQUIRED_FILES=("main.py" "config.py" "etl_functions.py" "test_connections.py")
+REQUIRED_FILES=("main.py" "config.py" "env_loader.py" "etl_functions.py" "test_connections.py")
 ALL_FILES_OK=true
 
 for file in "${REQUIRED_FILES[@]}"; do
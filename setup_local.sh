@@ -49,6 +49,7 @@ POSTGRES_PASSWORD=geo@2025!@
 ETL_LOAD_STRATEGY=replace
 ETL_QUERY_TIMEOUT=300
 ETL_BATCH_SIZE=100
+ETL_ORACLE_ARRAYSIZE=5000
 ETL_LOG_LEVEL=DEBUG
 
 # DIRETÓRIOS (desenvolvimento local)